@@ -9,8 +9,12 @@ pre-submit hooks can block the release until resolved.
 
 from __future__ import annotations
 
+import functools
+import mmap
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Iterable, Tuple
 
@@ -30,41 +34,251 @@ SCAN_EXTENSIONS = {
     ".xcconfig",
 }
 
+# Patterns run over raw UTF-8 bytes, where `\s` only covers ASCII. This
+# fragment restores the full set `str` patterns treat as whitespace (e.g.
+# NBSP, ideographic space) so pasted literals are still caught.
+UNICODE_SPACE = (
+    r"(?:[\t-\r\x1c-\x20]|\xc2[\x85\xa0]|\xe1\x9a\x80"
+    r"|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]|\xe2\x81\x9f|\xe3\x80\x80)"
+)
+
 # Suspicious patterns to flag. Each entry pairs a short label with the
-# compiled regular expression so we can surface concise diagnostics.
-SUSPICIOUS_PATTERNS: Tuple[Tuple[str, re.Pattern[str]], ...] = (
+# regular expression source and its `re` flags so we can surface concise
+# diagnostics. They are compiled lazily on first scan (see below) so that
+# importing this module as a library stays cheap.
+SUSPICIOUS_PATTERNS: Tuple[Tuple[str, str, int], ...] = (
     (
         "openai_key",
-        re.compile(r"sk-[A-Za-z0-9]{24,}"),
+        r"sk-[A-Za-z0-9]{24,}",
+        0,
     ),
     (
         "generic_token",
-        re.compile(
-            r"(?i)(api|token|secret|bearer)[-_ ]?(key|token)?\s*[:=]\s*['\"][A-Za-z0-9_\-]{20,}"
-        ),
+        r"(api|token|secret|bearer)[-_ ]?(key|token)?"
+        + UNICODE_SPACE
+        + r"*[:=]"
+        + UNICODE_SPACE
+        + r"*['\"][A-Za-z0-9_\-]{20,}",
+        re.IGNORECASE,
     ),
 )
 
+# Literal fragments at least one of which must appear for any pattern above
+# to match: the `sk-` prefix (case-sensitive) or a generic keyword (ASCII
+# case-insensitive). Keep these in sync when adding patterns.
+SECRET_PREFIX_ANCHOR = b"sk-"
+KEYWORD_ANCHORS = (b"api", b"token", b"secret", b"bearer")
+
+
+@functools.lru_cache(maxsize=1)
+def _compiled_patterns() -> Tuple[Tuple[str, re.Pattern[bytes]], ...]:
+    """Compile each labelled pattern as a bytes regex on first use.
+
+    Patterns stay separate rather than folded into one alternation: `re`
+    keeps its fast literal-prefix search for `sk-` only when that pattern
+    is compiled on its own, and separate passes also report a key nested
+    inside a generic token assignment under both labels.
+    """
+
+    return tuple(
+        (label, re.compile(source.encode(), flags))
+        for label, source, flags in SUSPICIOUS_PATTERNS
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _hyperscan_database():
+    """Compile every pattern into one Hyperscan database, if the binding exists.
+
+    Hyperscan is an optional accelerator that only decides which patterns
+    occur in a file; `None` means callers should run every `re` pattern.
+    """
+
+    try:
+        import hyperscan
+    except ImportError:
+        return None
+    flags = []
+    for _, _, pattern_flags in SUSPICIOUS_PATTERNS:
+        flag = hyperscan.HS_FLAG_SINGLEMATCH
+        if pattern_flags & re.IGNORECASE:
+            flag |= hyperscan.HS_FLAG_CASELESS
+        flags.append(flag)
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=[source.encode() for _, source, _ in SUSPICIOUS_PATTERNS],
+            ids=list(range(len(SUSPICIOUS_PATTERNS))),
+            flags=flags,
+        )
+    except hyperscan.error:
+        return None
+    return database
+
+
 # Relative paths that should be ignored entirely. Extend this list if a
 # future build introduces generated artifacts with placeholder values.
 IGNORE_PATHS = {
     Path("scripts/secret_scan.py"),  # Avoid flagging ourselves
 }
 
+# Directories never worth descending into: VCS metadata, build products,
+# generated output, and third-party environments. Entries containing a
+# slash are matched against the path relative to the scan root; bare
+# names are pruned wherever they appear.
+PRUNE_DIRS = {
+    ".git",
+    "DerivedData",
+    "build",
+    "_portfolio_output",
+    "fastlane/metadata",
+    "node_modules",
+    ".venv",
+}
+
+# Leading bytes inspected to decide whether a file is binary.
+BINARY_SNIFF_BYTES = 4096
+BINARY_PLIST_MAGIC = b"bplist00"
+
+# Files at least this large are memory-mapped instead of read into memory;
+# below it the mapping setup costs more than the copy it avoids.
+MMAP_THRESHOLD_BYTES = 8 * 1024
+
+# Window size used when counting newlines or pre-filtering inside a
+# memory-mapped file, bounding how much of it is copied at once.
+COUNT_WINDOW_BYTES = 1024 * 1024
+
 REPO_ROOT = Path(__file__).resolve().parent.parent
 
 
 def iter_candidate_files(root: Path) -> Iterable[Path]:
     """Yield repository files with extensions we want to inspect."""
 
-    for path in root.rglob("*"):
-        if not path.is_file():
-            continue
-        if path.relative_to(root) in IGNORE_PATHS:
+    stack = [(os.fspath(root), "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
             continue
-        if path.suffix.lower() not in SCAN_EXTENSIONS:
-            continue
-        yield path
+        with entries:
+            for entry in entries:
+                relative = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in PRUNE_DIRS and relative not in PRUNE_DIRS:
+                        stack.append((entry.path, relative + "/"))
+                    continue
+                if not entry.is_file():
+                    continue
+                # Match `Path.suffix` semantics: dotfiles like `.env` have no suffix.
+                if os.path.splitext(entry.name)[1].lower() not in SCAN_EXTENSIONS:
+                    continue
+                if Path(relative) in IGNORE_PATHS:
+                    continue
+                yield Path(entry.path)
+
+
+def _count_newlines(buffer, newline: bytes, start: int, end: int) -> int:
+    """Count `newline` in `buffer[start:end]` without copying the whole buffer."""
+
+    if isinstance(buffer, bytes):
+        return buffer.count(newline, start, end)
+    # mmap has no `count`; copy bounded windows so resident memory stays flat.
+    total = 0
+    for window in range(start, end, COUNT_WINDOW_BYTES):
+        total += buffer[window:min(window + COUNT_WINDOW_BYTES, end)].count(newline)
+    return total
+
+
+def _line_resolver(buffer):
+    """Return a `line_at(offset)` callable for non-decreasing match offsets.
+
+    Newlines are counted incrementally between successive matches, so a file
+    without findings costs nothing and the total work stays a single pass.
+    Files with classic Mac (CR-only) endings are counted by `\r`; mixed
+    endings within one file follow the `\n` count.
+    """
+
+    position = 0
+    line = 1
+    newline = None
+
+    def line_at(offset: int) -> int:
+        nonlocal position, line, newline
+        if newline is None:
+            newline = b"\n" if buffer.find(b"\n") != -1 else b"\r"
+        line += _count_newlines(buffer, newline, position, offset)
+        position = offset
+        return line
+
+    return line_at
+
+
+def _may_contain_secret(data: bytes) -> bool:
+    """Cheap substring pre-filter; `False` means no pattern can match."""
+
+    if SECRET_PREFIX_ANCHOR in data:
+        return True
+    lowered = data.lower()
+    return any(keyword in lowered for keyword in KEYWORD_ANCHORS)
+
+
+def _mapping_may_contain_secret(mapped: mmap.mmap) -> bool:
+    """Pre-filter for memory-mapped files that never copies the whole mapping.
+
+    Lowering the full mapping would allocate a file-sized copy, so keywords
+    are checked in bounded windows that overlap by one keyword length.
+    """
+
+    if mapped.find(SECRET_PREFIX_ANCHOR) != -1:
+        return True
+    overlap = max(map(len, KEYWORD_ANCHORS)) - 1
+    size = len(mapped)
+    for window in range(0, size, COUNT_WINDOW_BYTES):
+        lowered = mapped[window:min(window + COUNT_WINDOW_BYTES + overlap, size)].lower()
+        if any(keyword in lowered for keyword in KEYWORD_ANCHORS):
+            return True
+    return False
+
+
+def _regex_findings(buffer, patterns=None) -> list[tuple[int, str, str]]:
+    """Run each pattern (all of them by default) over `buffer` without decoding it.
+
+    Matches from all patterns are merged by offset so the report follows
+    file order.
+    """
+
+    if patterns is None:
+        patterns = _compiled_patterns()
+    matches = []
+    for order, (label, pattern) in enumerate(patterns):
+        for match in pattern.finditer(buffer):
+            matches.append((match.start(), order, label, match.group()))
+    if not matches:
+        return []
+    matches.sort()
+    line_at = _line_resolver(buffer)
+    return [
+        (line_at(start), label, snippet.decode("utf-8", errors="replace"))
+        for start, _, label, snippet in matches
+    ]
+
+
+def _hyperscan_hits(database, data: bytes) -> set[int]:
+    """Return the indices of patterns that match anywhere in `data`.
+
+    Patterns are compiled with `HS_FLAG_SINGLEMATCH`, so Hyperscan fires at
+    most one callback per pattern regardless of match length; exact spans
+    are then left to `re`.
+    """
+
+    hits: set[int] = set()
+
+    def on_match(pattern_id, start, end, flags, context):
+        hits.add(pattern_id)
+
+    database.scan(data, match_event_handler=on_match)
+    return hits
 
 
 def scan_file(path: Path) -> Iterable[Tuple[int, str, str]]:
@@ -74,26 +288,44 @@ def scan_file(path: Path) -> Iterable[Tuple[int, str, str]]:
     tuples whenever a regex matches.
     """
 
-    try:
-        contents = path.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        # Skip binary blobs that sneak in with matching extensions.
+    database = _hyperscan_database()
+    with path.open("rb") as handle:
+        head = handle.read(BINARY_SNIFF_BYTES)
+        # Skip binary blobs (including binary plists) that sneak in with
+        # matching extensions before paying for a full read.
+        if b"\x00" in head or head.startswith(BINARY_PLIST_MAGIC):
+            return []
+        if database is None and os.fstat(handle.fileno()).st_size >= MMAP_THRESHOLD_BYTES:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if not _mapping_may_contain_secret(mapped):
+                    return []
+                return _regex_findings(mapped)
+        data = head + handle.read()
+
+    # Most files contain none of the anchors, so skip the matcher entirely.
+    if not _may_contain_secret(data):
         return []
 
-    findings = []
-    for label, pattern in SUSPICIOUS_PATTERNS:
-        for match in pattern.finditer(contents):
-            line_number = contents.count("\n", 0, match.start()) + 1
-            findings.append((line_number, label, match.group()))
-    return findings
+    if database is None:
+        return _regex_findings(data)
+
+    hits = _hyperscan_hits(database, data)
+    if not hits:
+        return []
+    compiled = _compiled_patterns()
+    return _regex_findings(data, [compiled[index] for index in sorted(hits)])
 
 
 def main() -> int:
     findings: list[tuple[Path, int, str, str]] = []
 
-    for file_path in iter_candidate_files(REPO_ROOT):
-        for line_number, label, snippet in scan_file(file_path):
-            findings.append((file_path, line_number, label, snippet))
+    # Files are independent, so fan the scan out across processes; `map`
+    # preserves input order so the report stays deterministic.
+    paths = list(iter_candidate_files(REPO_ROOT))
+    with ProcessPoolExecutor() as executor:
+        for file_path, hits in zip(paths, executor.map(scan_file, paths, chunksize=32)):
+            for line_number, label, snippet in hits:
+                findings.append((file_path, line_number, label, snippet))
 
     if not findings:
         print("✅ Secret scan passed: no suspicious tokens detected.")
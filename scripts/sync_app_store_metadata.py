@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from pathlib import Path
 import re
 import sys
@@ -23,32 +24,130 @@ ASCII_MAP = {
 }
 
 
+ASCII_TABLE = str.maketrans(ASCII_MAP)
+
+LABELED_BULLET_RE = re.compile(r"^-\s+\*\*([^*]+)\*\*\s+(.*)$")
+BRACKETED_URL_RE = re.compile(r"<([^>]+)>")
+URL_RE = re.compile(r"https?://\S+")
+MAILTO_RE = re.compile(r"mailto:([^>\s]+)")
+EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+PHONE_RE = re.compile(r"\+?\d[\d\s().-]{5,}\d")
+
+
 def asciiize(text: str) -> str:
-    for src, dst in ASCII_MAP.items():
-        text = text.replace(src, dst)
-    return text
-
-
-def parse_sections(text: str) -> dict[str, list[str]]:
-    sections: dict[str, list[str]] = {}
-    current: str | None = None
-    for line in text.splitlines():
-        if line.startswith("## "):
-            heading = line[3:].strip()
-            heading = heading.split(" (")[0].strip()
-            current = heading
-            sections.setdefault(current, [])
-            continue
-        if current is not None:
-            sections[current].append(line)
+    return text.translate(ASCII_TABLE)
+
+
+@dataclass
+class Section:
+    lines: list[str] = field(default_factory=list)
+    bullets: dict[str, str] = field(default_factory=dict)
+    # Keyed by the lowercased `### ` heading text; see parse_subsections.
+    subsections: dict[str, list[str]] = field(default_factory=dict)
+    notes: list[str] = field(default_factory=list)
+
+
+def trim_blank_lines(lines: list[str]) -> list[str]:
+    start = 0
+    end = len(lines)
+    while start < end and not lines[start].strip():
+        start += 1
+    while end > start and not lines[end - 1].strip():
+        end -= 1
+    return lines[start:end]
+
+
+def split_headed_blocks(text: str, marker: str) -> list[tuple[str, str]]:
+    """Split `text` at lines starting with `marker` into `(heading, body)` pairs.
+
+    Anything before the first marker is discarded.
+    """
+    chunks = ("\n" + text).split("\n" + marker)
+    blocks: list[tuple[str, str]] = []
+    for index, chunk in enumerate(chunks[1:], start=1):
+        # The split consumed the newline that ended every block but the
+        # last; restore it so trailing blank lines are preserved.
+        if index < len(chunks) - 1:
+            chunk += "\n"
+        heading, _, body = chunk.partition("\n")
+        blocks.append((heading.strip(), body))
+    return blocks
+
+
+def parse_subsections(lines: list[str]) -> dict[str, list[str]]:
+    """Collect `### ` blocks in one pass, keyed by lowercased heading.
+
+    A heading may be indented and is matched case-insensitively; only the
+    first block per heading is kept. A block runs until the next unindented
+    `### ` line, so an indented heading both opens its own block and stays
+    part of the enclosing one.
+    """
+    subsections: dict[str, list[str]] = {}
+    open_blocks: list[list[str]] = []
+    for line in lines:
+        if line.startswith("### "):
+            open_blocks = []
+        else:
+            for block in open_blocks:
+                block.append(line)
+        stripped = line.strip()
+        if stripped.startswith("### "):
+            key = stripped[4:].lower()
+            if key not in subsections:
+                subsections[key] = []
+                open_blocks.append(subsections[key])
+    return {key: trim_blank_lines(block) for key, block in subsections.items()}
+
+
+def parse_sections(text: str) -> dict[str, Section]:
+    sections: dict[str, Section] = {}
+    for heading, body in split_headed_blocks(text, "## "):
+        current = sections.setdefault(heading.split(" (")[0].strip(), Section())
+        current.lines.extend(body.splitlines())
+
+    for section in sections.values():
+        section.bullets = parse_labeled_bullets(section.lines)
+        section.notes = extract_note_lines(section.lines)
+        section.subsections = parse_subsections(section.lines)
     return sections
 
 
+def strip_heading_marker(line: str) -> str:
+    hashes = len(line) - len(line.lstrip("#"))
+    if 1 <= hashes <= 6 and line[hashes:hashes + 1].isspace():
+        return line[hashes:].lstrip()
+    return line
+
+
+def unwrap_emphasis(line: str) -> str:
+    parts: list[str] = []
+    pos = 0
+    while True:
+        start = line.find("*", pos)
+        if start == -1:
+            break
+        end = line.find("*", start + 1)
+        if end == -1:
+            break
+        if end == start + 1:
+            # An empty `**` pair cannot wrap text; keep the first star.
+            parts.append(line[pos:end])
+            pos = end
+            continue
+        parts.append(line[pos:start])
+        parts.append(line[start + 1:end])
+        pos = end + 1
+    parts.append(line[pos:])
+    return "".join(parts)
+
+
 def strip_markdown(line: str) -> str:
-    line = re.sub(r"^#{1,6}\s+", "", line)
+    if line.startswith("#"):
+        line = strip_heading_marker(line)
     line = line.replace("**", "")
-    line = re.sub(r"\*([^*]+)\*", r"\1", line)
-    return line
+    if "*" not in line:
+        return line
+    return unwrap_emphasis(line)
 
 
 def normalize_plain(lines: list[str]) -> str:
@@ -63,9 +162,8 @@ def normalize_markdown(lines: list[str]) -> str:
 
 def parse_labeled_bullets(lines: list[str]) -> dict[str, str]:
     data: dict[str, str] = {}
-    pattern = re.compile(r"^-\s+\*\*([^*]+)\*\*\s+(.*)$")
     for line in lines:
-        match = pattern.match(line.strip())
+        match = LABELED_BULLET_RE.match(line.strip())
         if match:
             label = match.group(1).strip().rstrip(":")
             data[label] = match.group(2).strip()
@@ -75,10 +173,10 @@ def parse_labeled_bullets(lines: list[str]) -> dict[str, str]:
 def extract_url(value: str) -> str:
     if not value:
         return ""
-    bracketed = re.search(r"<([^>]+)>", value)
+    bracketed = BRACKETED_URL_RE.search(value)
     if bracketed:
         return bracketed.group(1)
-    match = re.search(r"https?://\S+", value)
+    match = URL_RE.search(value)
     if match:
         return match.group(0).rstrip(").,")
     return value.split()[0]
@@ -87,10 +185,10 @@ def extract_url(value: str) -> str:
 def extract_email(value: str) -> str:
     if not value:
         return ""
-    match = re.search(r"mailto:([^>\\s]+)", value)
+    match = MAILTO_RE.search(value)
     if match:
         return match.group(1)
-    match = re.search(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\\.[A-Za-z]{2,}", value)
+    match = EMAIL_RE.search(value)
     if match:
         return match.group(0)
     return value.split()[0]
@@ -99,33 +197,12 @@ def extract_email(value: str) -> str:
 def extract_phone(value: str) -> str:
     if not value:
         return ""
-    match = re.search(r"\\+?\\d[\\d\\s().-]{6,}", value)
+    match = PHONE_RE.search(value)
     if match:
         return match.group(0).strip()
     return value.strip()
 
 
-def extract_subsection(lines: list[str], heading: str) -> list[str]:
-    start = None
-    marker = f"### {heading}".strip().lower()
-    for idx, line in enumerate(lines):
-        if line.strip().lower() == marker:
-            start = idx + 1
-            break
-    if start is None:
-        return []
-    block: list[str] = []
-    for line in lines[start:]:
-        if line.startswith("### "):
-            break
-        block.append(line)
-    while block and not block[0].strip():
-        block.pop(0)
-    while block and not block[-1].strip():
-        block.pop()
-    return block
-
-
 def extract_note_lines(lines: list[str]) -> list[str]:
     notes = []
     for line in lines:
@@ -175,10 +252,10 @@ def main() -> int:
         print("Missing release notes section (expected 'What's New in X.Y.Z')", file=sys.stderr)
         return 1
 
-    quick_ref = parse_labeled_bullets(sections["Quick Reference"])
-    urls = parse_labeled_bullets(sections["URLs"])
-    review_section = sections.get("Review Information", [])
-    review_info = parse_labeled_bullets(review_section)
+    quick_ref = sections["Quick Reference"].bullets
+    urls = sections["URLs"].bullets
+    review_section = sections.get("Review Information", Section())
+    review_info = review_section.bullets
 
     try:
         name = require(quick_ref, "Name")
@@ -200,10 +277,10 @@ def main() -> int:
     files = {
         "name.txt": asciiize(name),
         "subtitle.txt": asciiize(subtitle),
-        "promotional_text.txt": normalize_plain(sections["Promotional Text"]),
-        "description.txt": normalize_markdown(sections["Full Description"]),
-        "keywords.txt": normalize_plain(sections["Keywords"]),
-        "release_notes.txt": normalize_markdown(sections[release_key]),
+        "promotional_text.txt": normalize_plain(sections["Promotional Text"].lines),
+        "description.txt": normalize_markdown(sections["Full Description"].lines),
+        "keywords.txt": normalize_plain(sections["Keywords"].lines),
+        "release_notes.txt": normalize_markdown(sections[release_key].lines),
         "marketing_url.txt": asciiize(marketing_url),
         "support_url.txt": asciiize(support_url),
         "privacy_url.txt": asciiize(privacy_url),
@@ -211,14 +288,14 @@ def main() -> int:
         "secondary_category.txt": asciiize(secondary_category),
     }
 
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
+    # Collect every rendered file first so nothing is written unless all of
+    # the metadata validates, then flush them in a single pass.
+    outputs: dict[Path, str] = {}
     for filename, content in files.items():
         if not content:
             print(f"Missing content for {filename}", file=sys.stderr)
             return 1
-        path = OUTPUT_DIR / filename
-        path.write_text(f"{content.strip()}\n", encoding="utf-8")
+        outputs[OUTPUT_DIR / filename] = content
 
     review_files: dict[str, str] = {}
     if review_info:
@@ -241,14 +318,14 @@ def main() -> int:
         availability = review_info.get("Availability")
         if availability:
             notes_parts.append(f"Availability: {strip_markdown(availability)}")
-        demo_content = extract_subsection(review_section, "Demo Content Provided")
+        demo_content = review_section.subsections.get("demo content provided", [])
         demo_content = [line for line in demo_content if not line.strip().lower().startswith("note:")]
         if demo_content:
             notes_parts.append("Demo content provided:\n" + normalize_markdown(demo_content))
-        walkthrough = extract_subsection(sections.get("Review Information", []), "Reviewer Walkthrough")
+        walkthrough = review_section.subsections.get("reviewer walkthrough", [])
         if walkthrough:
             notes_parts.append("Reviewer walkthrough:\n" + normalize_markdown(walkthrough))
-        note_lines = extract_note_lines(review_section)
+        note_lines = review_section.notes
         if note_lines:
             notes_parts.append("\n".join(note_lines))
         notes = "\n\n".join(notes_parts).strip()
@@ -262,14 +339,17 @@ def main() -> int:
         if notes:
             review_files["notes.txt"] = asciiize(notes)
 
+    for filename, content in review_files.items():
+        if not content:
+            print(f"Missing content for review information {filename}", file=sys.stderr)
+            return 1
+        outputs[REVIEW_INFO_DIR / filename] = content
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     if review_files:
         REVIEW_INFO_DIR.mkdir(parents=True, exist_ok=True)
-        for filename, content in review_files.items():
-            if not content:
-                print(f"Missing content for review information {filename}", file=sys.stderr)
-                return 1
-            path = REVIEW_INFO_DIR / filename
-            path.write_text(f"{content.strip()}\n", encoding="utf-8")
+    for path, content in outputs.items():
+        path.write_bytes(f"{content.strip()}\n".encode("utf-8"))
 
     written = ", ".join(sorted(files.keys()))
     if review_files: